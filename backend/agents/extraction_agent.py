@@ -1,15 +1,24 @@
 import os
-import json
+import orjson
 import re
-import time
+import operator
 import random
-import requests
+import hashlib
+import asyncio
+import httpx
 import urllib.parse
-import xml.etree.ElementTree as ET
-import difflib
-from typing import List, Dict, TypedDict, Optional
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, TypedDict, Optional, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
+from rapidfuzz import fuzz, process
+from aiolimiter import AsyncLimiter
+from lxml import etree
+from cachetools import LRUCache, TTLCache
 from langgraph.graph import StateGraph, END
 
 # PDF processing imports
@@ -41,15 +50,151 @@ def get_random_user_agent() -> str:
     return random.choice(USER_AGENTS)
 
 
+# Concurrency and rate limits (requests/second) for PDF fetching (arXiv asks clients to throttle)
+ARXIV_MAX_CONCURRENCY = 5
+OPEN_ACCESS_MAX_CONCURRENCY = 15
+ARXIV_RATE_LIMIT = 5
+OPEN_ACCESS_RATE_LIMIT = 20
+
+# Shared connection pool and retry policy for PDF fetching
+HTTP_POOL_SIZE = 32
+HTTP_MAX_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.5
+HTTP_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Streaming limits for PDF downloads
+PDF_CHUNK_SIZE = 64 * 1024
+PDF_MAX_BYTES = 500 * 1024 * 1024
+PDF_PROBE_BYTES = 1024
+
+# Fetched PDFs are checkpointed so a crashed run can resume without refetching
+# (one file per set of screened papers)
+CHECKPOINT_DIR = "fetch_checkpoints"
+CHECKPOINT_INTERVAL = 10
+
+# Fuzzy arXiv matches this close to the best score are kept as ranked fallbacks
+ARXIV_CANDIDATE_MARGIN = 5
+# Minimum words in a title, and share of the longer title's words it must cover,
+# before containment alone counts as a match
+ARXIV_MIN_CONTAINED_WORDS = 4
+ARXIV_MIN_CONTAINED_COVERAGE = 0.75
+
+# arXiv title lookups keyed by normalized title (hits map to candidate PDF links)
+# Both are bounded; misses expire so a transient arXiv failure doesn't block a title for good
+ARXIV_CACHE_SIZE = 1024
+ARXIV_NEGATIVE_TTL = 60 * 60
+_ARXIV_URL_CACHE = LRUCache(maxsize=ARXIV_CACHE_SIZE)
+_ARXIV_NEGATIVE_CACHE = TTLCache(maxsize=ARXIV_CACHE_SIZE, ttl=ARXIV_NEGATIVE_TTL)
+_ARXIV_CACHE_LOCK = threading.Lock()
+
+# Precompiled patterns for title normalization and arXiv ID lookup
+_WS_RE = re.compile(r'\s+')
+_ARXIV_ABSTRACT_RE = re.compile(r'arXiv:(\d{4}\.\d{4,5})')
+_ARXIV_URL_RE = re.compile(r'(\d{4}\.\d{4,5}|[a-z\-]+/\d{7})')
+
+# Atom namespace and Clark-notation tags, so lookups skip prefix resolution
+_ATOM_NS = 'http://www.w3.org/2005/Atom'
+_ATOM_TITLE = f'{{{_ATOM_NS}}}title'
+_ATOM_LINK = f'{{{_ATOM_NS}}}link'
+
+# Compiled once; selects every <entry> in an arXiv Atom feed
+_ARXIV_ENTRIES_XPATH = etree.XPath("//atom:entry", namespaces={'atom': _ATOM_NS})
+
+
 class ExtractionState(TypedDict):
     screened_papers: List[Dict]
     papers_with_pdfs: List[Dict]
     papers_with_text: List[Dict]
     extraction_results: Dict
+    fetch_checkpoint: str
+
+
+
+# Per-host (semaphore, rate limiter) pairs, keyed "arxiv" / "open_access"
+HostLimits = Dict[str, Tuple[asyncio.Semaphore, AsyncLimiter]]
+
+
+def _create_host_limits() -> HostLimits:
+    """Build the per-host limits for one fetch run (they bind to the running event loop)"""
+    return {
+        "arxiv": (asyncio.Semaphore(ARXIV_MAX_CONCURRENCY), AsyncLimiter(ARXIV_RATE_LIMIT, 1)),
+        "open_access": (asyncio.Semaphore(OPEN_ACCESS_MAX_CONCURRENCY), AsyncLimiter(OPEN_ACCESS_RATE_LIMIT, 1))
+    }
+
+
+def _host_limit(url: str, limits: HostLimits) -> Tuple[asyncio.Semaphore, AsyncLimiter]:
+    """Pick the concurrency and rate limits for the host serving this URL"""
+    host = urllib.parse.urlparse(url).netloc
+    return limits["arxiv"] if host.endswith("arxiv.org") else limits["open_access"]
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """
+    Build the pooled client used for one fetch run
+    Keep-alive connections are reused across papers hitting the same host,
+    and the transport retries failed connection attempts
+    """
+    transport = httpx.AsyncHTTPTransport(
+        retries=HTTP_MAX_RETRIES,
+        limits=httpx.Limits(max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE)
+    )
+    return httpx.AsyncClient(transport=transport, timeout=45, follow_redirects=True)
+
+
+async def _http_request(client: httpx.AsyncClient, limits: HostLimits, url: str, read_body, **kwargs):
+    """
+    Stream a GET under its per-host semaphore and rate limiter and hand the response to read_body
+    Rate-limit and server errors are retried with exponential backoff
+    """
+    semaphore, rate_limiter = _host_limit(url, limits)
+    
+    for attempt in range(HTTP_MAX_RETRIES + 1):
+        async with semaphore, rate_limiter:
+            async with client.stream("GET", url, **kwargs) as response:
+                if response.status_code not in HTTP_RETRY_STATUSES or attempt == HTTP_MAX_RETRIES:
+                    return await read_body(response)
+        
+        await asyncio.sleep(HTTP_RETRY_BACKOFF * (2 ** attempt))
 
 
+async def _read_full_body(response: httpx.Response) -> httpx.Response:
+    """Buffer the whole body so the response is usable after the stream closes"""
+    await response.aread()
+    return response
 
-def fetch_pdf_from_arxiv(arxiv_id: str) -> Optional[bytes]:
+
+async def _read_pdf_body(response: httpx.Response) -> Optional[bytes]:
+    """
+    Read a PDF body in PDF_CHUNK_SIZE chunks
+    Gives up after the first chunk if it lacks the %PDF magic, or once PDF_MAX_BYTES is exceeded
+    """
+    response.raise_for_status()
+    
+    pdf_data = bytearray()
+    async for chunk in response.aiter_bytes(PDF_CHUNK_SIZE):
+        if not pdf_data and not chunk.startswith(b'%PDF'):
+            print(f"  [SKIP] URL did not return a PDF")
+            return None
+        
+        pdf_data.extend(chunk)
+        if len(pdf_data) > PDF_MAX_BYTES:
+            print(f"  [SKIP] PDF exceeds {PDF_MAX_BYTES // (1024 * 1024)} MB")
+            return None
+    
+    return bytes(pdf_data) if pdf_data else None
+
+
+async def _http_get(client: httpx.AsyncClient, limits: HostLimits, url: str, **kwargs) -> httpx.Response:
+    """GET a URL and buffer the full response"""
+    return await _http_request(client, limits, url, _read_full_body, **kwargs)
+
+
+async def _download_pdf(client: httpx.AsyncClient, limits: HostLimits, url: str, **kwargs) -> Optional[bytes]:
+    """Stream a PDF download, returning None if the URL does not serve a valid PDF"""
+    return await _http_request(client, limits, url, _read_pdf_body, **kwargs)
+
+
+async def fetch_pdf_from_arxiv(client: httpx.AsyncClient, limits: HostLimits, arxiv_id: str) -> Optional[bytes]:
     """
     Fetch PDF directly from arXiv using arXiv ID
     """
@@ -63,17 +208,14 @@ def fetch_pdf_from_arxiv(arxiv_id: str) -> Optional[bytes]:
         headers = {'User-Agent': 'LitScoutResearchBot/1.0'}
         
         print(f"  Fetching arXiv PDF: {arxiv_id}")
-        response = requests.get(pdf_url, headers=headers, timeout=45)
-        response.raise_for_status()
-        
-        return response.content
+        return await _download_pdf(client, limits, pdf_url, headers=headers, timeout=45)
         
     except Exception as e:
         print(f"  Error fetching arXiv PDF: {e}")
         return None
 
 
-def fetch_pdf_from_open_access(open_access_info: Dict) -> Optional[bytes]:
+async def fetch_pdf_from_open_access(client: httpx.AsyncClient, limits: HostLimits, open_access_info: Dict) -> Optional[bytes]:
     """
     Fetch PDF from OpenAccess URL if available
     """
@@ -90,89 +232,190 @@ def fetch_pdf_from_open_access(open_access_info: Dict) -> Optional[bytes]:
         print(f"  Fetching OpenAccess PDF from: {pdf_url[:50]}...")
         
         headers = {'User-Agent': get_random_user_agent(), 'Accept': 'application/pdf,*/*'}
-        response = requests.get(pdf_url, headers=headers, timeout=45)
-        response.raise_for_status()
-        
-        # Verify it's actually a PDF
-        if response.content[:4] == b'%PDF':
-            return response.content
-        else:
-            print(f"  [SKIP] URL did not return a PDF")
-            return None
+        # Verified as a PDF while streaming
+        return await _download_pdf(client, limits, pdf_url, headers=headers, timeout=45)
         
     except Exception as e:
         print(f"  Error fetching OpenAccess PDF: {e}")
         return None
 
 
-def search_arxiv_for_pdf(title: str) -> Optional[bytes]:
+@lru_cache(maxsize=4096)
+def _normalize_title(title: str) -> str:
+    """Lowercase a title and collapse whitespace for matching and cache keys"""
+    return _WS_RE.sub(' ', title.lower()).strip()
+
+
+def _entry_pdf_link(entry) -> Optional[str]:
+    """Return the PDF link of an arXiv Atom entry"""
+    for link in entry.findall(_ATOM_LINK):
+        if link.get('title') == 'pdf':
+            return link.get('href')
+    return None
+
+
+def _title_contains(norm_title_a: str, norm_title_b: str) -> bool:
+    """
+    Check whether one normalized title contains the other as a whole run of words
+    The shorter title needs ARXIV_MIN_CONTAINED_WORDS words and must cover
+    ARXIV_MIN_CONTAINED_COVERAGE of the longer one, so "bert" doesn't match
+    "albert: a lite bert ..." and a generic title doesn't match every paper extending it
+    """
+    shorter, longer = sorted((norm_title_a, norm_title_b), key=len)
+    shorter_words, longer_words = len(shorter.split()), len(longer.split())
+    if shorter_words < ARXIV_MIN_CONTAINED_WORDS or shorter_words < ARXIV_MIN_CONTAINED_COVERAGE * longer_words:
+        return False
+    return f" {shorter} " in f" {longer} "
+
+
+async def _arxiv_search_urls(client: httpx.AsyncClient, limits: HostLimits, title: str, norm_title_orig: str) -> Optional[List[str]]:
+    """
+    Query the arXiv API by title and return PDF links of the matching entries, best first
+    Fuzzy matches within ARXIV_CANDIDATE_MARGIN of the best score are all kept
+    Returns an empty list when no entry is close enough, and None when the feed
+    had no entries at all (arXiv does this under load, so it is not a real miss)
+    """
+    # Clean title for query
+    clean_title = re.sub(r'[^\w\s]', ' ', title).strip()
+    encoded_title = urllib.parse.quote(f"ti:{clean_title}")
+    
+    api_url = f"http://export.arxiv.org/api/query?search_query={encoded_title}&start=0&max_results=3"
+    
+    response = await _http_get(client, limits, api_url, timeout=10)
+    response.raise_for_status()
+    
+    # Parse Atom XML
+    root = etree.fromstring(response.content)
+    
+    entries = _ARXIV_ENTRIES_XPATH(root)
+    if not entries:
+        return None
+    
+    # Exact and containment matches are accepted without fuzzy scoring
+    entry_titles = []
+    best_idx, best_similarity = None, 0
+    for idx, entry in enumerate(entries):
+        norm_title_found = _normalize_title(entry.find(_ATOM_TITLE).text)
+        if norm_title_found == norm_title_orig:
+            best_idx, best_similarity = idx, 100
+            break
+        if best_idx is None and _title_contains(norm_title_orig, norm_title_found):
+            best_idx, best_similarity = idx, 95
+        entry_titles.append(norm_title_found)
+    
+    if best_idx is not None:
+        candidates = [best_idx]
+    else:
+        # Otherwise score every title (token-sort ratio tolerates reordered words but,
+        # unlike token-set ratio, doesn't score a short title 100 against any longer one containing it)
+        scored = process.extract(norm_title_orig, entry_titles, scorer=fuzz.token_sort_ratio, limit=None)
+        best_similarity = scored[0][1]
+        candidates = [idx for _, similarity, idx in scored
+                      if similarity >= 70 and similarity >= best_similarity - ARXIV_CANDIDATE_MARGIN]
+    
+    if best_similarity < 70:
+        print(f"  [SKIP] Best arXiv match too loose ({best_similarity:.0f})")
+        return []
+    
+    pdf_links = [link for link in (_entry_pdf_link(entries[idx]) for idx in candidates) if link]
+    if pdf_links:
+        print(f"  Found {len(pdf_links)} matching arXiv PDF(s) (similarity: {best_similarity:.0f})")
+    
+    return pdf_links
+
+
+async def _read_pdf_magic(response: httpx.Response) -> bool:
+    """Check only the first chunk of a body for the %PDF magic"""
+    response.raise_for_status()
+    async for chunk in response.aiter_bytes(PDF_PROBE_BYTES):
+        return chunk.startswith(b'%PDF')
+    return False
+
+
+async def _probe_pdf(client: httpx.AsyncClient, limits: HostLimits, url: str, **kwargs) -> bool:
+    """Ask for the first PDF_PROBE_BYTES of a URL and report whether it serves a PDF"""
+    headers = {**kwargs.pop("headers", {}), "Range": f"bytes=0-{PDF_PROBE_BYTES - 1}"}
+    return await _http_request(client, limits, url, _read_pdf_magic, headers=headers, **kwargs)
+
+
+async def _download_best_pdf(client: httpx.AsyncClient, limits: HostLimits, urls: List[str], **kwargs) -> Optional[bytes]:
+    """
+    Download the best-ranked candidate PDF that is actually available
+    Candidates are probed in parallel with a small Range request, then downloaded
+    in rank order, so the result never depends on which server answers first
+    A candidate whose download fails falls through to the next one
+    """
+    if len(urls) > 1:
+        probes = await asyncio.gather(*(_probe_pdf(client, limits, url, **kwargs) for url in urls), return_exceptions=True)
+        urls = [url for url, ok in zip(urls, probes) if ok is True]
+    
+    for url in urls:
+        try:
+            pdf_bytes = await _download_pdf(client, limits, url, **kwargs)
+        except httpx.HTTPError as e:
+            print(f"  [SKIP] arXiv candidate {url} failed: {e}")
+            continue
+        if pdf_bytes:
+            return pdf_bytes
+    
+    return None
+
+
+async def search_arxiv_for_pdf(client: httpx.AsyncClient, limits: HostLimits, title: str) -> Optional[bytes]:
     """
     Search arXiv API by title to find PDF
     Improved with better similarity matching
+    Lookups are cached by normalized title; misses expire after ARXIV_NEGATIVE_TTL seconds
     """
     if not title:
         return None
+    
+    norm_title = _normalize_title(title)
+    if not norm_title:
+        return None
+    
+    with _ARXIV_CACHE_LOCK:
+        known_miss = norm_title in _ARXIV_NEGATIVE_CACHE
+        pdf_links = _ARXIV_URL_CACHE.get(norm_title)
+    
+    if known_miss:
+        print(f"  [SKIP] No arXiv match (cached)")
+        return None
         
     try:
-        # Clean title for query
-        clean_title = re.sub(r'[^\w\s]', ' ', title).strip()
-        encoded_title = urllib.parse.quote(f"ti:{clean_title}")
-        
-        api_url = f"http://export.arxiv.org/api/query?search_query={encoded_title}&start=0&max_results=3"
-        
-        response = requests.get(api_url, timeout=10)
-        response.raise_for_status()
-        
-        # Parse Atom XML
-        root = ET.fromstring(response.content)
-        ns = {'atom': 'http://www.w3.org/2005/Atom'}
-        
-        entries = root.findall('atom:entry', ns)
-        if not entries:
-            return None
+        if pdf_links is None:
+            pdf_links = await _arxiv_search_urls(client, limits, title, norm_title)
+            if pdf_links is None:
+                return None
+            with _ARXIV_CACHE_LOCK:
+                if pdf_links:
+                    _ARXIV_URL_CACHE[norm_title] = pdf_links
+                else:
+                    _ARXIV_NEGATIVE_CACHE[norm_title] = True
+            if not pdf_links:
+                return None
         
-        # Normalize original title
-        norm_title_orig = re.sub(r'\s+', ' ', title.lower())
-        
-        best_match = None
-        best_similarity = 0
-        
-        # Check all results for best match
-        for entry in entries:
-            entry_title = entry.find('atom:title', ns).text.strip()
-            norm_title_found = re.sub(r'\s+', ' ', entry_title.lower())
-            
-            similarity = difflib.SequenceMatcher(None, norm_title_orig, norm_title_found).ratio()
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = entry
-        
-      
-        if best_similarity < 0.7:
-            print(f"  [SKIP] Best arXiv match too loose ({best_similarity:.2f})")
-            return None
-        
-        # Find PDF link
-        pdf_link = None
-        for link in best_match.findall('atom:link', ns):
-            if link.get('title') == 'pdf':
-                pdf_link = link.get('href')
-                break
-        
-        if pdf_link:
-            print(f"  Found matching arXiv PDF (similarity: {best_similarity:.2f})")
-            pdf_response = requests.get(pdf_link, headers={'User-Agent': 'LitScoutResearchBot/1.0'}, timeout=30)
-            pdf_response.raise_for_status()
-            return pdf_response.content
-            
-        return None
+        return await _download_best_pdf(client, limits, pdf_links, headers={'User-Agent': 'LitScoutResearchBot/1.0'}, timeout=30)
         
     except Exception as e:
         print(f"  Error searching arXiv: {e}")
         return None
 
 
+@lru_cache(maxsize=4096)
+def _arxiv_id_from_abstract(abstract: str) -> Optional[str]:
+    """Find an arXiv ID cited in an abstract"""
+    match = _ARXIV_ABSTRACT_RE.search(abstract)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=4096)
+def _arxiv_id_from_url(url: str) -> Optional[str]:
+    """Find an arXiv ID in an arxiv.org URL"""
+    match = _ARXIV_URL_RE.search(url)
+    return match.group(1) if match else None
+
+
 def extract_arxiv_id_from_paper(paper: Dict) -> Optional[str]:
     """
     Try to extract arXiv ID from paper metadata
@@ -188,16 +431,16 @@ def extract_arxiv_id_from_paper(paper: Dict) -> Optional[str]:
     # Check abstract for arXiv ID
     abstract = paper.get('abstract', '')
     if abstract:
-        match = re.search(r'arXiv:(\d{4}\.\d{4,5})', abstract)
-        if match:
-            return match.group(1)
+        arxiv_id = _arxiv_id_from_abstract(abstract)
+        if arxiv_id:
+            return arxiv_id
     
     # Check URL for arXiv pattern
     url = paper.get('url', '')
     if 'arxiv.org' in url:
-        match = re.search(r'(\d{4}\.\d{4,5}|[a-z\-]+/\d{7})', url)
-        if match:
-            return match.group(1)
+        arxiv_id = _arxiv_id_from_url(url)
+        if arxiv_id:
+            return arxiv_id
     
     return None
 
@@ -206,6 +449,58 @@ def extract_arxiv_id_from_paper(paper: Dict) -> Optional[str]:
 # TEXT EXTRACTION FUNCTIONS
 # ========================
 
+# Precompiled patterns used on every line/block of every PDF
+_HEADER_RE = re.compile(r'^(page|\d+|figure|table|www\.|http|doi:|arxiv:)', re.IGNORECASE)
+_COPYRIGHT_RE = re.compile(r'(copyright|©|\(c\)|license|permission|reprinted)', re.IGNORECASE)
+_REFERENCES_RE = re.compile(r'^\s*(reference|bibliography)', re.IGNORECASE)
+
+# Drops NULs and turns vertical tab/form feed into spaces in one C-level pass
+_CONTROL_CHAR_TABLE = str.maketrans('\x0b\x0c', '  ', '\x00')
+
+# Improved section patterns (more flexible)
+# Note: Abstract is NOT extracted as it's already available from Semantic Scholar
+SECTION_PATTERNS = {
+    "introduction": [
+        r'^\s*introduction\s*:?\s*$',
+        r'^\s*\d+\.?\s*introduction',
+        r'^\s*[ivxIVX]+\.?\s*introduction',
+    ],
+    "methods": [
+        r'^\s*\d+\.?\s*(method|methodology|approach|materials?)',
+        r'^\s*[ivxIVX]+\.?\s*(method|methodology)',
+        r'^\s*(method|methodology)\s*:?\s*$',
+        r'materials?\s+and\s+methods?',
+        r'experimental\s+(setup|design|procedure|methods?)',
+    ],
+    "results": [
+        r'^\s*\d+\.?\s*(result|finding|experiment)s?',
+        r'^\s*[ivxIVX]+\.?\s*(result|finding)s?',
+        r'^\s*(result|finding)s?\s*:?\s*$',
+        r'experimental\s+results?',
+    ],
+    "discussion": [
+        r'^\s*\d+\.?\s*discussion',
+        r'^\s*[ivxIVX]+\.?\s*discussion',
+        r'^\s*discussion\s*:?\s*$',
+        r'results?\s+and\s+discussion',
+    ],
+    "conclusion": [
+        r'^\s*\d+\.?\s*(conclusion|summary|future\s+work)',
+        r'^\s*[ivxIVX]+\.?\s*(conclusion|summary)',
+        r'^\s*(conclusion|summary)\s*:?\s*$',
+    ]
+}
+
+# All section patterns fused into one alternation; m.lastgroup names the section
+# Each branch is anchored at position 0 with a lazy prefix and used with .match,
+# so the first section in SECTION_PATTERNS order with a match anywhere in the block
+# wins (not whichever match starts leftmost)
+_COMBINED_SECTION_RE = re.compile(
+    '|'.join(f"(?P<{name}>(?s:.*?)(?:{'|'.join(patterns)}))" for name, patterns in SECTION_PATTERNS.items()),
+    re.IGNORECASE
+)
+
+
 def clean_pdf_text(text: str) -> str:
     """
     Clean extracted PDF text
@@ -213,7 +508,7 @@ def clean_pdf_text(text: str) -> str:
     if not text:
         return ""
     
-    lines = text.split('\n')
+    lines = text.translate(_CONTROL_CHAR_TABLE).split('\n')
     cleaned_lines = []
     
     for line in lines:
@@ -224,7 +519,7 @@ def clean_pdf_text(text: str) -> str:
             continue
         
         # Skip common headers/footers
-        if re.match(r'^(page|\d+|figure|table|www\.|http|doi:|arxiv:)', line, re.IGNORECASE):
+        if _HEADER_RE.match(line):
             continue
         
         # Skip single characters or pure numbers
@@ -232,124 +527,89 @@ def clean_pdf_text(text: str) -> str:
             continue
         
         # Skip copyright/license notices
-        if re.search(r'(copyright|©|\(c\)|license|permission|reprinted)', line, re.IGNORECASE):
+        if _COPYRIGHT_RE.search(line):
             continue
         
         cleaned_lines.append(line)
     
     # Join and normalize whitespace
-    cleaned_text = ' '.join(cleaned_lines)
-    cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+    cleaned_text = ' '.join(' '.join(cleaned_lines).split())
     
     return cleaned_text
 
 
-def extract_text_from_pdf(pdf_bytes: bytes) -> Dict[str, str]:
+def _iter_sorted_blocks(doc):
+    """
+    Yield text blocks as (page, x0, y0, x1, y1, text, ...) in reading order
+    Each page is extracted only when the previous one has been consumed,
+    and its textpage is freed before any of its blocks are yielded
+    """
+    for page in doc:
+        textpage = page.get_textpage(flags=fitz.TEXTFLAGS_BLOCKS)
+        blocks = sorted(textpage.extractBLOCKS(), key=operator.itemgetter(1, 0))
+        del textpage
+        for block in blocks:
+            yield (page.number,) + tuple(block)
+
+
+def extract_text_from_pdf(pdf_path: str) -> Dict[str, str]:
     """
     Extract text from PDF with IMPROVED section detection
     Handles numbered sections, various formats, and provides fallback logic
     """
     try:
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        doc = fitz.open(pdf_path, filetype="pdf")
         
+        # Section text is collected as lists of blocks and joined once at the end
         full_text = []
-        sections = {
-            "title": "",
-            "introduction": "",
-            "methods": "",
-            "results": "",
-            "discussion": "",
-            "conclusion": "",
-            "full_text": ""
-        }
+        title = ""
+        title_found = False
+        section_blocks = {section_name: [] for section_name in SECTION_PATTERNS}
         
         current_section = None
         
-        # Improved section patterns (more flexible)
-        # Note: Abstract is NOT extracted as it's already available from Semantic Scholar
-        section_patterns = {
-            "introduction": [
-                r'^\s*introduction\s*:?\s*$',
-                r'^\s*\d+\.?\s*introduction',
-                r'^\s*[ivxIVX]+\.?\s*introduction',
-            ],
-            "methods": [
-                r'^\s*\d+\.?\s*(method|methodology|approach|materials?)',
-                r'^\s*[ivxIVX]+\.?\s*(method|methodology)',
-                r'^\s*(method|methodology)\s*:?\s*$',
-                r'materials?\s+and\s+methods?',
-                r'experimental\s+(setup|design|procedure|methods?)',
-            ],
-            "results": [
-                r'^\s*\d+\.?\s*(result|finding|experiment)s?',
-                r'^\s*[ivxIVX]+\.?\s*(result|finding)s?',
-                r'^\s*(result|finding)s?\s*:?\s*$',
-                r'experimental\s+results?',
-            ],
-            "discussion": [
-                r'^\s*\d+\.?\s*discussion',
-                r'^\s*[ivxIVX]+\.?\s*discussion',
-                r'^\s*discussion\s*:?\s*$',
-                r'results?\s+and\s+discussion',
-            ],
-            "conclusion": [
-                r'^\s*\d+\.?\s*(conclusion|summary|future\s+work)',
-                r'^\s*[ivxIVX]+\.?\s*(conclusion|summary)',
-                r'^\s*(conclusion|summary)\s*:?\s*$',
-            ]
-        }
-        
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            blocks = page.get_text("blocks")
-            blocks = sorted(blocks, key=lambda b: (b[1], b[0]))
+        # Blocks are pulled one page at a time, so pages after the references are never parsed
+        for block in _iter_sorted_blocks(doc):
+            page_num = block[0]
+            text = block[5].strip()
             
-            for block in blocks:
-                text = block[4].strip()
-                
-                if not text:
-                    continue
-                
-                text_lower = text.lower()
-                
-                # Title detection (first page only)
-                if page_num == 0 and len(sections["title"]) == 0:
-                    if len(text.split()) >= 3 and len(text) < 200:
-                        sections["title"] = text
-                        continue
-                
-                # Check for references (stop processing)
-                if re.search(r'^\s*(reference|bibliography)', text_lower):
-                    break
-                
-                # Section detection (try all patterns)
-                section_detected = False
-                for section_name, patterns in section_patterns.items():
-                    if any(re.search(p, text_lower) for p in patterns):
-                        current_section = section_name
-                        section_detected = True
-                        print(f"  [SECTION] {section_name.upper()}: '{text[:50]}'")
-                        break
-                
-                if section_detected:
+            if not text:
+                continue
+            
+            # Title detection (first page only, skipped once found)
+            if not title_found and page_num == 0:
+                if len(text.split()) >= 3 and len(text) < 200:
+                    title = text
+                    title_found = True
                     continue
-                
-                # Append to current section ONLY if a section has been detected
-                # Do NOT use fallback logic that dumps everything into introduction
-                if current_section and current_section in sections:
-                    sections[current_section] += " " + text
-                
-                # Always append to full text
-                full_text.append(text)
+            
+            # Check for references (stop processing the rest of the document)
+            if _REFERENCES_RE.search(text):
+                break
+            
+            # Section detection (single pass over all patterns)
+            section_match = _COMBINED_SECTION_RE.match(text)
+            if section_match:
+                current_section = section_match.lastgroup
+                print(f"  [SECTION] {current_section.upper()}: '{text[:50]}'")
+                continue
+            
+            # Append to current section ONLY if a section has been detected
+            # Do NOT use fallback logic that dumps everything into introduction
+            if current_section:
+                section_blocks[current_section].append(text)
+            
+            # Always append to full text
+            full_text.append(text)
         
         doc.close()
         
         # Clean all sections
-        for key in sections:
-            sections[key] = clean_pdf_text(sections[key])
+        sections = {"title": clean_pdf_text(title)}
+        for section_name, blocks in section_blocks.items():
+            sections[section_name] = clean_pdf_text(' '.join(blocks))
         
-        sections["full_text"] = ' '.join(full_text)
-        sections["full_text"] = clean_pdf_text(sections["full_text"])
+        sections["full_text"] = clean_pdf_text(' '.join(full_text))
         
         # Debug: Print section lengths
         print(f"  [EXTRACTION SUMMARY]")
@@ -376,12 +636,210 @@ def extract_text_from_pdf(pdf_bytes: bytes) -> Dict[str, str]:
 # NODE 1: FETCH PDFs
 # ========================
 
+def _save_pdf(pdf_bytes: bytes, pdf_dir: str) -> str:
+    """Write a fetched PDF to a temp file so the bytes don't live in graph state"""
+    fd, pdf_path = tempfile.mkstemp(suffix=".pdf", dir=pdf_dir)
+    with os.fdopen(fd, "wb") as f:
+        f.write(pdf_bytes)
+    return pdf_path
+
+
+async def _tag_source(source: str, coro) -> Tuple[str, Optional[bytes]]:
+    """Await a fetch strategy and pair its result with the source name"""
+    return source, await coro
+
+
+async def _fetch_paper_pdf(client: httpx.AsyncClient, limits: HostLimits, paper: Dict, pdf_dir: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Fetch one paper's PDF and save it under pdf_dir
+    The arXiv-ID and OpenAccess sources identify the paper exactly, so they are raced
+    and the slower one is cancelled. The fuzzy title search only runs if both come up empty
+    Returns (pdf_path, source, failure_reason)
+    """
+    open_access_info = paper.get("openAccessPdf")
+    strategies = []
+    
+    # Strategy 1: Check for arXiv ID in metadata
+    arxiv_id = extract_arxiv_id_from_paper(paper)
+    if arxiv_id:
+        strategies.append(("arxiv_direct", fetch_pdf_from_arxiv(client, limits, arxiv_id)))
+    
+    # Strategy 2: Try OpenAccess URL
+    if open_access_info:
+        strategies.append(("open_access", fetch_pdf_from_open_access(client, limits, open_access_info)))
+    
+    tasks = [asyncio.create_task(_tag_source(source, coro)) for source, coro in strategies]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            source, pdf_bytes = await next_done
+            if pdf_bytes:
+                return _save_pdf(pdf_bytes, pdf_dir), source, None
+    finally:
+        for task in tasks:
+            task.cancel()
+    
+    # Strategy 3: Search arXiv by title (fallback only)
+    pdf_bytes = await search_arxiv_for_pdf(client, limits, paper.get("title"))
+    if pdf_bytes:
+        return _save_pdf(pdf_bytes, pdf_dir), "arxiv_search", None
+    
+    if open_access_info and open_access_info.get("url"):
+        return None, None, "OpenAccess URL invalid or not a PDF"
+    return None, None, "No arXiv match found by title"
+
+
+def _paper_checkpoint_key(paper: Dict) -> Optional[str]:
+    """
+    Stable key for a paper: DOI, then arXiv ID, then Semantic Scholar paperId, then a hash of the title
+    Returns None when the paper has none of these, so it is never checkpointed
+    """
+    external_ids = paper.get('externalIds') or {}
+    doi = external_ids.get('DOI') if isinstance(external_ids, dict) else None
+    if doi:
+        return f"doi:{doi.lower()}"
+    
+    arxiv_id = extract_arxiv_id_from_paper(paper)
+    if arxiv_id:
+        return f"arxiv:{arxiv_id}"
+    
+    paper_id = paper.get('paperId')
+    if paper_id:
+        return f"s2:{paper_id}"
+    
+    title = (paper.get('title') or '').strip()
+    if title:
+        return f"sha1:{hashlib.sha1(title.encode('utf-8')).hexdigest()}"
+    
+    return None
+
+
+def _fetch_checkpoint_path(screened_papers: List[Dict]) -> str:
+    """
+    Checkpoint file for this set of screened papers
+    Rerunning the same papers resumes from it, while other runs use their own file
+    """
+    paper_keys = sorted(key for key in map(_paper_checkpoint_key, screened_papers) if key)
+    digest = hashlib.sha1("\n".join(paper_keys).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(CHECKPOINT_DIR, f"{digest}.jsonl")
+
+
+def _read_fetch_checkpoint(checkpoint_path: str) -> List[Dict]:
+    """Read the raw records of a checkpoint file"""
+    if not os.path.exists(checkpoint_path):
+        return []
+    
+    records = []
+    try:
+        with open(checkpoint_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    records.append(orjson.loads(line))
+    except Exception as e:
+        print(f"  [WARN] Could not read fetch checkpoint: {e}")
+    
+    return records
+
+
+def _load_fetch_checkpoint(checkpoint_path: str) -> Dict[str, Dict]:
+    """
+    Load fetched-PDF records keyed by paper key
+    Records whose PDF file no longer exists are ignored
+    """
+    return {
+        record["paper_id"]: record
+        for record in _read_fetch_checkpoint(checkpoint_path)
+        if os.path.exists(record.get("pdf_path", ""))
+    }
+
+
+def _append_fetch_checkpoint(checkpoint_path: str, records: List[Dict]):
+    """Append fetched-PDF records to the checkpoint file"""
+    if not records:
+        return
+    
+    try:
+        os.makedirs(os.path.dirname(checkpoint_path), exist_ok=True)
+        with open(checkpoint_path, "ab") as f:
+            for record in records:
+                f.write(orjson.dumps(record) + b"\n")
+    except Exception as e:
+        print(f"  [WARN] Could not write fetch checkpoint: {e}")
+
+
+def _claim_checkpointed_pdf(record: Dict, pdf_dir: str) -> Optional[str]:
+    """
+    Move a checkpointed PDF into this run's pdf_dir and return its new path
+    The rename is atomic, so when two runs resume the same record only one gets the file;
+    the other gets None and refetches the paper
+    """
+    claimed_path = os.path.join(pdf_dir, os.path.basename(record["pdf_path"]))
+    try:
+        os.rename(record["pdf_path"], claimed_path)
+    except OSError:
+        return None
+    return claimed_path
+
+
+def _prune_fetch_checkpoint(checkpoint_path: str, removed_paths: List[str]):
+    """
+    Drop checkpoint records whose PDFs were deleted or no longer exist
+    The file is removed once no records are left
+    """
+    removed = set(removed_paths)
+    records = [
+        record for record in _read_fetch_checkpoint(checkpoint_path)
+        if record.get("pdf_path") not in removed and os.path.exists(record.get("pdf_path", ""))
+    ]
+    
+    try:
+        if records:
+            # Write a sibling file and swap it in so readers never see a half-written checkpoint
+            tmp_path = f"{checkpoint_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                for record in records:
+                    f.write(orjson.dumps(record) + b"\n")
+            os.replace(tmp_path, checkpoint_path)
+        elif os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+    except Exception as e:
+        print(f"  [WARN] Could not prune fetch checkpoint: {e}")
+
+
+async def _fetch_all_pdfs(screened_papers: List[Dict], pdf_dir: str, checkpoint_path: str) -> List:
+    """
+    Fetch PDFs for all papers concurrently
+    Successful fetches are checkpointed every CHECKPOINT_INTERVAL papers
+    The client and semaphores are created per run since they bind to the running event loop
+    """
+    limits = _create_host_limits()
+    pending_records = []
+    
+    async def fetch_and_checkpoint(paper: Dict):
+        pdf_path, source, failure_reason = await _fetch_paper_pdf(client, limits, paper, pdf_dir)
+        paper_key = _paper_checkpoint_key(paper)
+        if pdf_path and paper_key:
+            pending_records.append({"paper_id": paper_key, "pdf_path": pdf_path, "source": source})
+            if len(pending_records) >= CHECKPOINT_INTERVAL:
+                _append_fetch_checkpoint(checkpoint_path, pending_records)
+                pending_records.clear()
+        return pdf_path, source, failure_reason
+    
+    async with _create_http_client() as client:
+        tasks = [fetch_and_checkpoint(paper) for paper in screened_papers]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    _append_fetch_checkpoint(checkpoint_path, pending_records)
+    return results
+
+
 def fetch_pdfs_node(state: ExtractionState) -> Dict:
     """
     Fetch PDFs with improved strategy:
     1. Check for arXiv ID in metadata
     2. Try OpenAccess URL if valid
     3. Search arXiv by title with better matching
+    Papers are fetched concurrently, throttled per host
+    Papers already in the fetch checkpoint reuse their saved PDF
     """
     print("\n" + "="*80)
     print("EXTRACTION STAGE 1: FETCHING PDFs")
@@ -401,47 +859,49 @@ def fetch_pdfs_node(state: ExtractionState) -> Dict:
         "failure_reasons": []
     }
     
-    for i, paper in enumerate(screened_papers, 1):
+    # PDFs go to temp files; only their paths travel through the graph state
+    pdf_dir = tempfile.mkdtemp(prefix="litscout_pdfs_")
+    
+    # Resume from the checkpoint: papers fetched by an earlier run are not refetched
+    # Their PDFs are claimed into this run's pdf_dir, so a concurrent run can't reuse or delete them
+    checkpoint_path = _fetch_checkpoint_path(screened_papers)
+    checkpoint = _load_fetch_checkpoint(checkpoint_path)
+    results = [None] * len(screened_papers)
+    to_fetch = []
+    claimed_records = []
+    for idx, paper in enumerate(screened_papers):
+        record = checkpoint.get(_paper_checkpoint_key(paper))
+        pdf_path = _claim_checkpointed_pdf(record, pdf_dir) if record else None
+        if pdf_path:
+            results[idx] = (pdf_path, record["source"], None)
+            claimed_records.append({**record, "pdf_path": pdf_path})
+        else:
+            to_fetch.append(idx)
+    
+    if claimed_records:
+        _append_fetch_checkpoint(checkpoint_path, claimed_records)
+        print(f"Resuming {len(claimed_records)} papers from {checkpoint_path}")
+    
+    fetched = asyncio.run(_fetch_all_pdfs([screened_papers[idx] for idx in to_fetch], pdf_dir, checkpoint_path))
+    for idx, result in zip(to_fetch, fetched):
+        results[idx] = result
+    
+    for i, (paper, result) in enumerate(zip(screened_papers, results), 1):
         safe_print(f"\n[{i}/{len(screened_papers)}] {paper.get('title', 'Untitled')[:60]}...")
         
-        pdf_bytes = None
-        source = None
-        failure_reason = None
-        
-        # Strategy 1: Check for arXiv ID in metadata
-        arxiv_id = extract_arxiv_id_from_paper(paper)
-        if arxiv_id:
-            pdf_bytes = fetch_pdf_from_arxiv(arxiv_id)
-            if pdf_bytes:
-                source = "arxiv_direct"
-                fetch_stats["arxiv_direct"] += 1
-        
-        # Strategy 2: Try OpenAccess URL
-        if not pdf_bytes:
-            open_access_info = paper.get("openAccessPdf")
-            pdf_bytes = fetch_pdf_from_open_access(open_access_info)
-            if pdf_bytes:
-                source = "open_access"
-                fetch_stats["open_access"] += 1
-            elif open_access_info and open_access_info.get("url"):
-                failure_reason = "OpenAccess URL invalid or not a PDF"
-        
-        # Strategy 3: Search arXiv by title
-        if not pdf_bytes:
-            pdf_bytes = search_arxiv_for_pdf(paper.get("title"))
-            if pdf_bytes:
-                source = "arxiv_search"
-                fetch_stats["arxiv_search"] += 1
-            else:
-                failure_reason = failure_reason or "No arXiv match found by title"
+        if isinstance(result, BaseException):
+            pdf_path, source, failure_reason = None, None, f"Fetch error: {result}"
+        else:
+            pdf_path, source, failure_reason = result
         
-        if pdf_bytes:
+        if pdf_path:
+            fetch_stats[source] += 1
             papers_with_pdfs.append({
                 **paper,
-                "pdf_bytes": pdf_bytes,
+                "pdf_path": pdf_path,
                 "pdf_source": source
             })
-            print(f"  [OK] PDF fetched from {source} ({len(pdf_bytes)/1024:.1f} KB)")
+            print(f"  [OK] PDF fetched from {source} ({os.path.getsize(pdf_path)/1024:.1f} KB)")
         else:
             fetch_stats["failed"] += 1
             fetch_stats["failure_reasons"].append({
@@ -449,9 +909,9 @@ def fetch_pdfs_node(state: ExtractionState) -> Dict:
                 "reason": failure_reason or "Unknown"
             })
             print(f"  [FAIL] PDF not available - {failure_reason or 'Unknown reason'}")
-        
-        # Rate limiting
-        time.sleep(0.5)
+    
+    if not os.listdir(pdf_dir):
+        os.rmdir(pdf_dir)
     
     print(f"\n{'='*80}")
     print(f"PDF Fetch Summary:")
@@ -466,7 +926,8 @@ def fetch_pdfs_node(state: ExtractionState) -> Dict:
     
     return {
         "papers_with_pdfs": papers_with_pdfs,
-        "extraction_results": {"fetch_stats": fetch_stats}
+        "extraction_results": {"fetch_stats": fetch_stats},
+        "fetch_checkpoint": checkpoint_path
     }
 
 
@@ -474,6 +935,38 @@ def fetch_pdfs_node(state: ExtractionState) -> Dict:
 # NODE 2: EXTRACT TEXT
 # ========================
 
+def _extract_texts_parallel(pdf_paths: List[str]) -> List[Dict[str, str]]:
+    """
+    Run extract_text_from_pdf over several PDFs in a process pool
+    Results are returned in input order
+    """
+    if len(pdf_paths) < 2:
+        return [extract_text_from_pdf(pdf_path) for pdf_path in pdf_paths]
+    
+    # spawn, not fork: this runs in a worker thread of the server, and forking a
+    # multithreaded process can copy a lock some other thread holds
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(pdf_paths)),
+                             mp_context=multiprocessing.get_context("spawn")) as pool:
+        return list(pool.map(extract_text_from_pdf, pdf_paths))
+
+
+def _remove_pdf_files(pdf_paths: List[str]):
+    """Delete fetched PDF temp files and their now-empty directories"""
+    pdf_dirs = set()
+    for pdf_path in pdf_paths:
+        pdf_dirs.add(os.path.dirname(pdf_path))
+        try:
+            os.remove(pdf_path)
+        except OSError:
+            pass
+    
+    for pdf_dir in pdf_dirs:
+        try:
+            os.rmdir(pdf_dir)
+        except OSError:
+            pass
+
+
 def extract_text_node(state: ExtractionState) -> Dict:
     """
     Extract text from PDFs with section detection
@@ -496,20 +989,25 @@ def extract_text_node(state: ExtractionState) -> Dict:
     
     total_length = 0
     
+    # Papers are independent and parsing is CPU-bound, so spread it across processes
+    pdf_paths = [paper["pdf_path"] for paper in papers_with_pdfs if paper.get("pdf_path")]
+    extracted_sections = iter(_extract_texts_parallel(pdf_paths))
+    _remove_pdf_files(pdf_paths)
+    if state.get("fetch_checkpoint"):
+        _prune_fetch_checkpoint(state["fetch_checkpoint"], pdf_paths)
+    
     for i, paper in enumerate(papers_with_pdfs, 1):
         safe_print(f"\n[{i}/{len(papers_with_pdfs)}] Extracting: {paper.get('title', 'Untitled')[:60]}...")
         
-        pdf_bytes = paper.get("pdf_bytes")
-        
-        if not pdf_bytes:
+        if not paper.get("pdf_path"):
             extraction_stats["failed_extractions"] += 1
             continue
         
-        sections = extract_text_from_pdf(pdf_bytes)
+        sections = next(extracted_sections)
         
         if sections["full_text"] and len(sections["full_text"]) > 500:
-            # Don't include pdf_bytes in output (too large)
-            paper_data = {k: v for k, v in paper.items() if k != "pdf_bytes"}
+            # Don't include the temp file path in output
+            paper_data = {k: v for k, v in paper.items() if k != "pdf_path"}
             
             papers_with_text.append({
                 **paper_data,
@@ -595,8 +1093,8 @@ def finalize_extraction_node(state: ExtractionState) -> Dict:
     
     # Save to file
     try:
-        with open("extracted_data.json", "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        with open("extracted_data.json", "wb") as f:
+            f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         print(f"\n[OK] Saved extracted_data.json ({len(papers_with_text)} papers)")
     except Exception as e:
         print(f"\n[FAIL] Error saving file: {e}")
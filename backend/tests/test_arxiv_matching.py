@@ -0,0 +1,110 @@
+import sys
+import os
+import asyncio
+
+import pytest
+
+# Make the project root importable, same as backend/test.py
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+extraction_agent = pytest.importorskip("backend.agents.extraction_agent")
+httpx = pytest.importorskip("httpx")
+
+
+def _atom_feed(*entries):
+    """Build a minimal arXiv Atom feed from (title, pdf_url) pairs"""
+    entry_xml = "".join(
+        f'<entry><title>{title}</title><link title="pdf" href="{pdf_url}" rel="related"/></entry>'
+        for title, pdf_url in entries
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">{entry_xml}</feed>'
+
+
+def _search(title, *entries):
+    """Run _arxiv_search_urls for a title against a mocked feed"""
+    feed = _atom_feed(*entries)
+    
+    async def run():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, text=feed))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await extraction_agent._arxiv_search_urls(
+                client, extraction_agent._create_host_limits(), title, extraction_agent._normalize_title(title)
+            )
+    
+    return asyncio.run(run())
+
+
+def test_short_title_does_not_match_longer_title_containing_its_words():
+    assert _search(
+        "BERT",
+        ("ALBERT: A Lite BERT for Self-supervised Learning of Language Representations",
+         "https://arxiv.org/pdf/1909.11942"),
+    ) == []
+    assert _search(
+        "Attention Is All You Need",
+        ("Attention Is Not All You Need: Pure Attention Loses Rank Doubly Exponentially with Depth",
+         "https://arxiv.org/pdf/2103.03404"),
+    ) == []
+
+
+def test_bert_does_not_match_albert():
+    # Regression: the containment guard alone let the fuzzy step accept ALBERT for "BERT"
+    assert _search(
+        "BERT",
+        ("ALBERT: A Lite BERT for Self-supervised Learning of Language Representations",
+         "https://arxiv.org/pdf/1909.11942"),
+        ("BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding",
+         "https://arxiv.org/pdf/1810.04805"),
+    ) == []
+
+
+def test_generic_title_does_not_match_longer_title_containing_it():
+    assert _search(
+        "Attention Is All You Need",
+        ("Attention Is All You Need For Chinese Word Segmentation",
+         "https://arxiv.org/pdf/1910.14537"),
+    ) == []
+
+
+def test_contained_title_matches_when_it_covers_most_words():
+    assert _search(
+        "Pre-training of Deep Bidirectional Transformers for Language Understanding",
+        ("BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding",
+         "https://arxiv.org/pdf/1810.04805"),
+    ) == ["https://arxiv.org/pdf/1810.04805"]
+
+
+def test_exact_title_matches():
+    assert _search(
+        "Attention Is All You Need",
+        ("Attention Is All You Need", "https://arxiv.org/pdf/1706.03762"),
+    ) == ["https://arxiv.org/pdf/1706.03762"]
+
+
+def test_reordered_title_matches():
+    assert _search(
+        "Learning Deep Residual Networks for Image Recognition",
+        ("Deep Residual Networks for Image Recognition Learning", "https://arxiv.org/pdf/1512.03385"),
+    ) == ["https://arxiv.org/pdf/1512.03385"]
+
+
+def test_empty_feed_is_inconclusive():
+    assert _search("Attention Is All You Need") is None
+
+
+def test_download_falls_through_to_next_candidate_on_http_error():
+    first_url, second_url = "https://arxiv.org/pdf/1111.11111", "https://arxiv.org/pdf/2222.22222"
+    
+    def handler(request):
+        # Both candidates pass the Range probe, but the top one 404s on the full download
+        if str(request.url) == first_url and "Range" not in request.headers:
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"%PDF-1.4 " + str(request.url).encode())
+    
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await extraction_agent._download_best_pdf(
+                client, extraction_agent._create_host_limits(), [first_url, second_url]
+            )
+    
+    assert asyncio.run(run()) == b"%PDF-1.4 " + second_url.encode()
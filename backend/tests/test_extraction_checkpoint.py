@@ -0,0 +1,101 @@
+import sys
+import os
+
+import pytest
+
+# Make the project root importable, same as backend/test.py
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+extraction_agent = pytest.importorskip("backend.agents.extraction_agent")
+
+
+def test_checkpoint_key_prefers_doi_then_arxiv_then_paper_id():
+    assert extraction_agent._paper_checkpoint_key(
+        {"externalIds": {"DOI": "10.1000/ABC"}, "paperId": "p1", "title": "A Title"}
+    ) == "doi:10.1000/abc"
+    assert extraction_agent._paper_checkpoint_key(
+        {"externalIds": {"ArXiv": "1234.5678"}, "paperId": "p1", "title": "A Title"}
+    ) == "arxiv:1234.5678"
+    assert extraction_agent._paper_checkpoint_key(
+        {"paperId": "p1", "title": "A Title"}
+    ) == "s2:p1"
+
+
+def test_checkpoint_key_falls_back_to_title_hash():
+    key = extraction_agent._paper_checkpoint_key({"title": "A Title"})
+    assert key.startswith("sha1:")
+    assert key != extraction_agent._paper_checkpoint_key({"title": "Another Title"})
+
+
+def test_checkpoint_key_is_none_without_identity():
+    assert extraction_agent._paper_checkpoint_key({}) is None
+    assert extraction_agent._paper_checkpoint_key({"title": None}) is None
+    assert extraction_agent._paper_checkpoint_key({"title": "   "}) is None
+
+
+def test_fetch_node_resumes_checkpointed_papers(tmp_path, monkeypatch):
+    monkeypatch.setattr(extraction_agent, "CHECKPOINT_DIR", str(tmp_path / "checkpoints"))
+    papers = [
+        {"paperId": "done", "title": "Already Fetched Paper"},
+        {"paperId": "todo", "title": "Paper Still To Fetch"},
+    ]
+    saved_pdf = tmp_path / "done.pdf"
+    saved_pdf.write_bytes(b"%PDF-1.4 fake")
+    
+    checkpoint_path = extraction_agent._fetch_checkpoint_path(papers)
+    extraction_agent._append_fetch_checkpoint(checkpoint_path, [
+        {"paper_id": "s2:done", "pdf_path": str(saved_pdf), "source": "open_access"}
+    ])
+    
+    fetched_titles = []
+    
+    async def fake_fetch_all_pdfs(screened_papers, pdf_dir, checkpoint_path):
+        fetched_titles.extend(paper["title"] for paper in screened_papers)
+        return [(None, None, "No arXiv match found by title") for _ in screened_papers]
+    
+    monkeypatch.setattr(extraction_agent, "_fetch_all_pdfs", fake_fetch_all_pdfs)
+    
+    result = extraction_agent.fetch_pdfs_node({"screened_papers": papers})
+    
+    assert fetched_titles == ["Paper Still To Fetch"]
+    assert result["extraction_results"]["fetch_stats"]["open_access"] == 1
+    assert result["fetch_checkpoint"] == checkpoint_path
+    
+    # The resumed PDF was claimed into this run's temp dir and re-recorded there
+    [claimed_path] = [paper["pdf_path"] for paper in result["papers_with_pdfs"]]
+    assert os.path.exists(claimed_path) and not saved_pdf.exists()
+    assert extraction_agent._load_fetch_checkpoint(checkpoint_path)["s2:done"]["pdf_path"] == claimed_path
+    extraction_agent._remove_pdf_files([claimed_path])
+
+
+def test_concurrent_runs_do_not_share_a_checkpointed_pdf(tmp_path):
+    saved_pdf = tmp_path / "shared.pdf"
+    saved_pdf.write_bytes(b"%PDF-1.4 fake")
+    record = {"paper_id": "s2:a", "pdf_path": str(saved_pdf), "source": "open_access"}
+    run_a_dir, run_b_dir = tmp_path / "run_a", tmp_path / "run_b"
+    run_a_dir.mkdir()
+    run_b_dir.mkdir()
+    
+    claimed_path = extraction_agent._claim_checkpointed_pdf(record, str(run_a_dir))
+    assert claimed_path == str(run_a_dir / "shared.pdf")
+    assert extraction_agent._claim_checkpointed_pdf(record, str(run_b_dir)) is None
+
+
+def test_prune_removes_records_for_deleted_pdfs(tmp_path, monkeypatch):
+    monkeypatch.setattr(extraction_agent, "CHECKPOINT_DIR", str(tmp_path / "checkpoints"))
+    kept_pdf = tmp_path / "kept.pdf"
+    kept_pdf.write_bytes(b"%PDF-1.4 fake")
+    removed_pdf = tmp_path / "removed.pdf"
+    removed_pdf.write_bytes(b"%PDF-1.4 fake")
+    
+    checkpoint_path = extraction_agent._fetch_checkpoint_path([{"paperId": "a"}, {"paperId": "b"}])
+    extraction_agent._append_fetch_checkpoint(checkpoint_path, [
+        {"paper_id": "s2:a", "pdf_path": str(kept_pdf), "source": "open_access"},
+        {"paper_id": "s2:b", "pdf_path": str(removed_pdf), "source": "arxiv_direct"},
+    ])
+    
+    extraction_agent._prune_fetch_checkpoint(checkpoint_path, [str(removed_pdf)])
+    assert list(extraction_agent._load_fetch_checkpoint(checkpoint_path)) == ["s2:a"]
+    
+    extraction_agent._prune_fetch_checkpoint(checkpoint_path, [str(kept_pdf)])
+    assert not os.path.exists(checkpoint_path)
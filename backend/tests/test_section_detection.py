@@ -0,0 +1,37 @@
+import sys
+import os
+
+import pytest
+
+# Make the project root importable, same as backend/test.py
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+extraction_agent = pytest.importorskip("backend.agents.extraction_agent")
+
+
+def _detect_section(text):
+    section_match = extraction_agent._COMBINED_SECTION_RE.match(text)
+    return section_match.lastgroup if section_match else None
+
+
+def _detect_section_per_pattern(text):
+    """The original loop: first section in SECTION_PATTERNS order with any match"""
+    for section_name, patterns in extraction_agent.SECTION_PATTERNS.items():
+        if any(extraction_agent.re.search(p, text.lower()) for p in patterns):
+            return section_name
+    return None
+
+
+@pytest.mark.parametrize("text, section", [
+    ("1. Introduction", "introduction"),
+    ("IV. Discussion", "discussion"),
+    ("Conclusion:", "conclusion"),
+    # Blocks matching several sections keep SECTION_PATTERNS order, not leftmost match
+    ("Results and discussion of the experimental setup", "methods"),
+    ("In the experimental results we compare materials and methods", "methods"),
+    ("Results and discussion", "discussion"),
+    ("Some ordinary paragraph text", None),
+])
+def test_section_precedence_matches_pattern_order(text, section):
+    assert _detect_section(text) == section
+    assert _detect_section_per_pattern(text) == section